@@ -12,6 +12,9 @@
 # - Internal implementation details are intentionally excluded.
 # - This file defines the conceptual boundary between the internal
 #   pipeline architecture and external users of the library.
+# - Exports that pull in the Earth Engine client are resolved lazily on
+#   first access, so lightweight entry points (e.g. the task monitor) do
+#   not pay the earthengine-api import cost.
 #
 # Responsibilities of this module:
 # - Expose the canonical public API of fire_assessment.
@@ -30,7 +33,15 @@
 
 
 from wildfire_analyser.fire_assessment.deliverables import Deliverable
-from wildfire_analyser.fire_assessment.mosaic_strategies import MosaicStrategy
+
+
+def __getattr__(name):
+    if name == "MosaicStrategy":
+        from wildfire_analyser.fire_assessment.mosaic_strategies import (
+            MosaicStrategy,
+        )
+        return MosaicStrategy
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 __all__ = [
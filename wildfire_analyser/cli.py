@@ -256,6 +256,17 @@ def main():
         ),
     )
 
+    parser.add_argument(
+        "--int16-exports",
+        action="store_true",
+        help=(
+            "Export bounded scientific GeoTIFFs (reflectance, NDVI/NBR and "
+            "their differences) as int16 scaled by 10000 instead of "
+            "floating point. RBR is always exported as floating point. "
+            "Multiply stored values by the reported scale_factor."
+        ),
+    )
+
     args = parser.parse_args()
 
     # ─────────────────────────────
@@ -372,6 +383,7 @@ def main():
             cloud_threshold=args.cloud_threshold,
             deliverables=deliverables, 
             gcs_bucket=gcs_bucket_name,
+            int16_exports=args.int16_exports,
             verbose=True,
         )
 
@@ -411,10 +423,11 @@ def main():
             logger.info("Scientific outputs:")
             for name, item in result["scientific"].items():
                 logger.info(
-                    "  %s -> %s (gee_task_id=%s)",
+                    "  %s -> %s (gee_task_id=%s, scale_factor=%g)",
                     name,
                     item["url"],
                     item.get("gee_task_id"),
+                    item.get("scale_factor", 1.0),
                 )
 
         logger.info("Visual outputs:")
@@ -10,10 +10,14 @@
 # Design notes:
 # - Authentication is performed using a service account JSON key provided
 #   via the GEE_PRIVATE_KEY_JSON environment variable.
-# - The service account key is written to a temporary file only for the
-#   duration required by the Earth Engine client library.
+# - The service account key is passed to the Earth Engine client in
+#   memory; it is never written to disk.
 # - This module intentionally avoids interactive authentication flows
 #   (e.g., OAuth browser login).
+# - The client is initialized against the Earth Engine high-volume
+#   endpoint by default. It trades per-request interactive latency (no
+#   result caching) for aggregate throughput, which suits the many
+#   concurrent requests issued by pipeline runs.
 #
 # Responsibilities of this module:
 # - Load environment variables from an optional .env file.
@@ -31,13 +35,20 @@ import ee
 import os
 import json
 from dotenv import load_dotenv
-from tempfile import NamedTemporaryFile
 
+GEE_HIGH_VOLUME_URL = "https://earthengine-highvolume.googleapis.com"
 
-def authenticate_gee(gee_key_json: str | None = None) -> None:
+
+def authenticate_gee(
+    gee_key_json: str | None = None,
+    high_volume: bool = True,
+) -> None:
     """
     Authenticate Google Earth Engine using a service account JSON
     stored in the GEE_PRIVATE_KEY_JSON environment variable.
+
+    When high_volume is True, the client targets the high-volume
+    endpoint; otherwise the default Earth Engine endpoint is used.
     """
 
     try:
@@ -46,13 +57,13 @@ def authenticate_gee(gee_key_json: str | None = None) -> None:
         raise ValueError("Invalid GEE_PRIVATE_KEY_JSON format") from e
 
     try:
-        with NamedTemporaryFile(mode="w+", suffix=".json") as f:
-            json.dump(key_dict, f)
-            f.flush()
-            credentials = ee.ServiceAccountCredentials(
-                key_dict["client_email"], f.name
-            )
-            ee.Initialize(credentials)
+        credentials = ee.ServiceAccountCredentials(
+            key_dict["client_email"], key_data=gee_key_json
+        )
+        ee.Initialize(
+            credentials,
+            opt_url=GEE_HIGH_VOLUME_URL if high_volume else None,
+        )
     except Exception as e:
         raise RuntimeError(
             "Failed to authenticate with Google Earth Engine") from e
@@ -55,8 +55,8 @@ DELIVERABLE_DEPENDENCIES = {
     # Statistical deliverables (derived summaries)
     #
     # These deliverables perform statistical aggregation over scientific
-    # products (e.g. area by severity class). They typically trigger
-    # immediate Earth Engine execution via getInfo().
+    # products (e.g. area by severity class). Their nodes return deferred
+    # reductions; PostFireAssessment evaluates and formats them.
     # ------------------------------------------------------------------
 
     Deliverable.DNBR_AREA_STATISTICS: {Dependency.DNBR_AREA_STATISTICS},
@@ -14,8 +14,8 @@
 #
 # - Statistical deliverables:
 #   Aggregated summaries computed from scientific products (e.g. burned
-#   area by severity class). These deliverables usually trigger immediate
-#   Earth Engine execution via getInfo().
+#   area by severity class). Their reductions stay deferred inside the
+#   DAG and are evaluated together when results are collected.
 #
 # - Visual deliverables:
 #   Qualitative representations intended for preview and reporting, such
@@ -67,9 +67,9 @@ class Deliverable(Enum):
     # Statistical deliverables
     #
     # Aggregated summaries computed from scientific deliverables, such as
-    # burned area by severity class. These deliverables usually trigger
-    # immediate Earth Engine execution via getInfo() and return structured
-    # numerical results rather than raster data.
+    # burned area by severity class. They are evaluated when results are
+    # collected and return structured numerical results rather than raster
+    # data.
     # ─────────────────────────────
     DNBR_AREA_STATISTICS = auto()
     DNDVI_AREA_STATISTICS = auto()
@@ -12,10 +12,16 @@
 #   separately via the Earth Engine task API or console.
 # - This module is intentionally limited to storage concerns and does not
 #   perform scientific processing or visualization logic.
+# - GeoTIFFs are written as Cloud Optimized GeoTIFFs (COG), so clients can
+#   read only the tiles intersecting their window via HTTP range requests
+#   instead of downloading the whole file.
+# - Exports may optionally be quantized to int16 with a fixed scale
+#   factor, which shrinks floating-point GeoTIFFs considerably. Consumers
+#   must multiply stored values by the returned scale_factor.
 #
 # Responsibilities of this module:
 # - Submit GeoTIFF export tasks to Google Cloud Storage.
-# - Define export parameters (region, scale, maxPixels, format).
+# - Define export parameters (region, scale, maxPixels, format, COG layout).
 # - Return stable references (GCS URL and task ID) for downstream consumers.
 #
 # Copyright (C) 2025
@@ -27,14 +33,32 @@
 
 import ee
 
+# Multiplier applied before casting to int16. Reflectance ([0, 1]) and
+# normalized indices ([-1, 1]) keep four decimal places.
+INT16_SCALE_FACTOR = 10_000
+
 
 def export_geotiff_to_gcs(
     image: ee.Image,
     roi: ee.Geometry,
     bucket: str,
     object_name: str,
-    scale: int
+    scale: int,
+    int16: bool = False,
 ) -> dict:
+    """
+    Submit an asynchronous GeoTIFF export task to Google Cloud Storage.
+
+    When int16 is True, values are multiplied by INT16_SCALE_FACTOR,
+    rounded to the nearest integer and stored as signed 16-bit integers;
+    the returned "scale_factor" must be applied when reading. Values
+    outside the int16 range (about ±3.27 before scaling) saturate to
+    -32768 / 32767, so callers should only enable it for bounded
+    products.
+    """
+    if int16:
+        image = image.multiply(INT16_SCALE_FACTOR).round().toInt16()
+
     task = ee.batch.Export.image.toCloudStorage(
         image=image,
         description=object_name,
@@ -44,10 +68,12 @@ def export_geotiff_to_gcs(
         scale=scale,
         maxPixels=1e13,
         fileFormat="GeoTIFF",
+        formatOptions={"cloudOptimized": True},
     )
     task.start()
 
     return {
         "url": f"https://storage.googleapis.com/{bucket}/{object_name}.tif",
         "gee_task_id": task.id,
+        "scale_factor": 1 / INT16_SCALE_FACTOR if int16 else 1.0,
     }
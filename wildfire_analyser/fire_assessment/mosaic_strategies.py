@@ -19,11 +19,13 @@ Copyright (C) 2025
 Marcelo Camargo.
 """
 
-import ee
-
 from enum import Enum
+from typing import Any, Callable, Dict
+
 import ee
 
+from wildfire_analyser.fire_assessment.sentinel2 import REFLECTANCE_BANDS
+
 
 class MosaicStrategy(str, Enum):
     """
@@ -56,20 +58,53 @@ def apply_mosaic_strategy(
     if isinstance(strategy, MosaicStrategy):
         strategy = strategy.value
 
-    strategies = {
-        MosaicStrategy.BEST_DATE_MOSAIC.value: best_date_mosaic,
-        MosaicStrategy.BEST_DATE_MASKED_MOSAIC.value: best_date_masked_mosaic,
-        MosaicStrategy.BEST_AVAILABLE_PER_TILE_MOSAIC.value: best_available_per_tile_mosaic,
-        MosaicStrategy.CLOUD_MASKED_LIGHT_MOSAIC.value: cloud_masked_light_mosaic,
-    }
-
-    func = strategies.get(strategy)
+    func = _STRATEGIES.get(strategy)
     if func is None:
         raise ValueError(f"Unknown mosaic strategy: '{strategy}'")
 
     return func(collection, context)
 
 
+def _filter_by_cloud_threshold(
+    collection: ee.ImageCollection,
+    context,
+) -> ee.ImageCollection:
+    """
+    Drop scenes above the configured CLOUDY_PIXEL_PERCENTAGE threshold.
+
+    Strategies apply this before any per-image map so that discarded
+    scenes are never processed server-side.
+    """
+    cloud_threshold = context.inputs.get("cloud_threshold")
+    if cloud_threshold is None:
+        return collection
+
+    return collection.filter(
+        ee.Filter.lte("CLOUDY_PIXEL_PERCENTAGE", cloud_threshold)
+    )
+
+
+# SCL classes treated as physically invalid observations:
+# 1 = saturated / defective, 3 = cloud shadow,
+# 9 = cloud high probability, 10 = cirrus.
+_INVALID_SCL_CLASSES = [1, 3, 9, 10]
+
+
+def _mask_invalid_scl(image: ee.Image) -> ee.Image:
+    """
+    Removes physically invalid pixels using the SCL band.
+
+    The invalid mask is built with a single remap lookup instead of a
+    chain of per-class comparisons.
+    """
+    invalid = image.select("SCL").remap(
+        _INVALID_SCL_CLASSES,
+        [1] * len(_INVALID_SCL_CLASSES),
+        0,
+    )
+    return image.updateMask(invalid.Not())
+
+
 def best_date_mosaic(
     collection: ee.ImageCollection,
     context,
@@ -86,28 +121,28 @@ def best_date_mosaic(
     - Mosaic is used only for spatial stitching
     """
 
-    cloud_threshold = context.inputs.get("cloud_threshold")
-
-    filtered = collection
-    if cloud_threshold is not None:
-        filtered = filtered.filter(
-            ee.Filter.lte("CLOUDY_PIXEL_PERCENTAGE", cloud_threshold)
-        )
-
-    # Derive sensing date (YYYY-MM-dd)
-    def add_date(image):
-        date = ee.Date(image.get("system:time_start")).format("YYYY-MM-dd")
-        return image.set("sensing_date", date)
-
-    dated = filtered.map(add_date)
+    filtered = _filter_by_cloud_threshold(collection, context)
 
-    # Pick best image to identify the best date
-    best_image = dated.sort("CLOUDY_PIXEL_PERCENTAGE").first()
-    best_date = best_image.get("sensing_date")
+    # Pick best image to identify the best date. A linear min reduction
+    # replaces a full sort of the collection.
+    min_cloud = ee.Number(
+        filtered.reduceColumns(
+            ee.Reducer.min(), ["CLOUDY_PIXEL_PERCENTAGE"]
+        ).get("min")
+    )
+    best_image = filtered.filter(
+        ee.Filter.eq("CLOUDY_PIXEL_PERCENTAGE", min_cloud)
+    ).first()
+
+    # Sensing day (UTC) of the best image, derived from its timestamp
+    # rather than from a per-image date property.
+    day_start = ee.Date(best_image.get("system:time_start")).update(
+        hour=0, minute=0, second=0
+    )
 
     # Rebuild collection using all tiles from that date
-    same_date = dated.filter(
-        ee.Filter.eq("sensing_date", best_date)
+    same_date = filtered.filter(
+        ee.Filter.date(day_start, day_start.advance(1, "day"))
     )
 
     return same_date.mosaic()
@@ -120,55 +155,41 @@ def cloud_masked_light_mosaic(
     """
     Pixel-based mosaic using cloud probability as a quality weight.
 
+    - Discards scenes above the cloud threshold before masking
     - Applies a light SCL cloud mask
     - Selects pixels with lower cloud probability across dates
     """
        
-    def _mask_scl_light(image: ee.Image) -> ee.Image:
+    def add_quality(image: ee.Image) -> ee.Image:
+        prob = image.select("MSK_CLDPRB")
         scl = image.select("SCL")
 
-        # Mask only clearly invalid observations
-        invalid = (
-            scl.eq(1)
-            .Or(scl.eq(3))   # Cloud shadow
-            .Or(scl.eq(9))   # High probability cloud
-            .Or(scl.eq(10))  # Cirrus
-        )
-        return image.updateMask(invalid.Not())
-
-    def _pixel_mosaic_by_cloud_prob(
-        collection: ee.ImageCollection,
-    ) -> ee.Image:
-
-        def add_quality(image: ee.Image) -> ee.Image:
-            prob = image.select("MSK_CLDPRB")
-            scl = image.select("SCL")
+        # Higher quality = lower cloud probability
+        quality = ee.Image(100).subtract(prob)
 
-            # Higher quality = lower cloud probability
-            quality = ee.Image(100).subtract(prob)
-
-            # Penalize cloud edges without fully masking them
-            quality = quality.where(
-                scl.eq(8),
-                quality.subtract(5)
-            )
+        # Penalize cloud edges without fully masking them
+        quality = quality.where(
+            scl.eq(8),
+            quality.subtract(5)
+        )
 
-            return image.addBands(quality.rename("quality"))
+        return image.addBands(quality.rename("quality"))
 
-        return (
-            collection
-            .map(add_quality)
-            .qualityMosaic("quality")
-        )
-    
-    masked = collection.map(_mask_scl_light)
-    mosaic = _pixel_mosaic_by_cloud_prob(masked)
+    filtered = _filter_by_cloud_threshold(collection, context)
 
-    # Remove auxiliary quality band from output
-    return mosaic.select(
-        mosaic.bandNames().remove("quality")
+    # Masking and quality scoring are fused into a single map so the
+    # collection is traversed once before the quality mosaic.
+    mosaic = (
+        filtered
+        .map(lambda image: add_quality(_mask_invalid_scl(image)))
+        .qualityMosaic("quality")
     )
 
+    # Keep only the reflectance bands consumed downstream; the band list
+    # is static, so no server-side bandNames() lookup is needed to drop
+    # the auxiliary quality band.
+    return mosaic.select(REFLECTANCE_BANDS)
+
 def best_date_masked_mosaic(
     collection: ee.ImageCollection,
     context,
@@ -182,23 +203,7 @@ def best_date_masked_mosaic(
     - Accepts data gaps
     """
 
-    def _mask_scl(image: ee.Image) -> ee.Image:
-        """
-        Removes physically invalid pixels using the SCL band.
-        """
-
-        scl = image.select("SCL")
-
-        invalid = (
-            scl.eq(1)        # Saturated / defective
-            .Or(scl.eq(3))   # Cloud shadow
-            .Or(scl.eq(9))   # Cloud high probability
-            .Or(scl.eq(10))  # Cirrus
-        )
-
-        return image.updateMask(invalid.Not())
-
-    return _mask_scl(best_date_mosaic(collection, context))
+    return _mask_invalid_scl(best_date_mosaic(collection, context))
 
 
 def best_available_per_tile_mosaic(
@@ -215,26 +220,35 @@ def best_available_per_tile_mosaic(
     - Mosaic is used only for spatial stitching
     """
 
-    cloud_threshold = context.inputs.get("cloud_threshold")
-
-    filtered = collection
-    if cloud_threshold is not None:
-        filtered = filtered.filter(
-            ee.Filter.lte("CLOUDY_PIXEL_PERCENTAGE", cloud_threshold)
-        )
-
-    tiles = ee.List(filtered.aggregate_array("MGRS_TILE")).distinct()
-
-    def select_best_for_tile(tile_id):
-        tile_collection = (
-            filtered
-            .filter(ee.Filter.eq("MGRS_TILE", tile_id))
-            .sort("CLOUDY_PIXEL_PERCENTAGE")
-        )
-        return ee.Image(tile_collection.first())
+    filtered = _filter_by_cloud_threshold(collection, context)
+
+    # Pair each distinct tile with its least cloudy scene in a single
+    # server-side join instead of filtering the collection once per tile.
+    best_per_tile = ee.Join.saveFirst(
+        matchKey="best",
+        ordering="CLOUDY_PIXEL_PERCENTAGE",
+        ascending=True,
+    ).apply(
+        primary=filtered.distinct("MGRS_TILE"),
+        secondary=filtered,
+        condition=ee.Filter.equals(
+            leftField="MGRS_TILE",
+            rightField="MGRS_TILE",
+        ),
+    )
 
     per_tile_best = ee.ImageCollection(
-        tiles.map(select_best_for_tile)
+        best_per_tile.map(lambda image: ee.Image(image.get("best")))
     )
 
     return per_tile_best.mosaic()
+
+
+# Single dispatch table, built once at import time. Defined after the
+# strategy functions it references.
+_STRATEGIES: Dict[str, Callable[[ee.ImageCollection, Any], ee.Image]] = {
+    MosaicStrategy.BEST_DATE_MOSAIC.value: best_date_mosaic,
+    MosaicStrategy.BEST_DATE_MASKED_MOSAIC.value: best_date_masked_mosaic,
+    MosaicStrategy.BEST_AVAILABLE_PER_TILE_MOSAIC.value: best_available_per_tile_mosaic,
+    MosaicStrategy.CLOUD_MASKED_LIGHT_MOSAIC.value: cloud_masked_light_mosaic,
+}
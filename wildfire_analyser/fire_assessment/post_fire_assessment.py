@@ -24,8 +24,9 @@
 
 import ee
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 from datetime import datetime, date
+from concurrent.futures import Future, ThreadPoolExecutor
 import uuid
 
 from wildfire_analyser.fire_assessment.auth import authenticate_gee
@@ -43,6 +44,7 @@ from wildfire_analyser.fire_assessment.visualization import (
     get_visual_thumbnail_url,
 )
 from wildfire_analyser.fire_assessment.dependencies import Dependency
+from wildfire_analyser.fire_assessment.products import format_area_statistics
 
 import logging
 
@@ -51,6 +53,26 @@ class PostFireAssessment:
 
     DEFAULT_SCALE = 10
 
+    # Upper bound on concurrent blocking Earth Engine requests issued
+    # while collecting results (thumbnail URLs, export task submission).
+    # Sized for the high-volume endpoint used by authenticate_gee().
+    MAX_CONCURRENT_REQUESTS = 16
+
+    # Deliverables whose values are bounded well inside the int16 range
+    # once scaled (reflectance, normalized indices and their differences).
+    # RBR is a ratio with an unbounded denominator and is always exported
+    # as floating point.
+    INT16_DELIVERABLES = frozenset({
+        Deliverable.RGB_PRE_FIRE,
+        Deliverable.RGB_POST_FIRE,
+        Deliverable.NDVI_PRE_FIRE,
+        Deliverable.NDVI_POST_FIRE,
+        Deliverable.DNDVI,
+        Deliverable.NBR_PRE_FIRE,
+        Deliverable.NBR_POST_FIRE,
+        Deliverable.DNBR,
+    })
+
     def __init__(
         self,
         gee_key_json: str,
@@ -63,6 +85,7 @@ class PostFireAssessment:
         pre_fire_mosaic_strategy: str = MosaicStrategy.BEST_AVAILABLE_PER_TILE_MOSAIC,  
         post_fire_mosaic_strategy: str = MosaicStrategy.BEST_AVAILABLE_PER_TILE_MOSAIC,
         gcs_bucket: str | None = None,
+        int16_exports: bool = False,
         verbose: bool = False,
     ):
         level = logging.INFO if verbose else logging.WARNING
@@ -78,9 +101,14 @@ class PostFireAssessment:
                 f"(got {start_date} > {end_date})"
             )
 
-        self.roi = self._load_geojson(Path(geojson_path))
+        geometry = self._load_geojson(Path(geojson_path))
+        self.roi = ee.Geometry(geometry)
+        # Exports only need a rectangular region; a client-side bounding
+        # box keeps the full ROI out of the export request.
+        self._roi_bounds = self._geojson_bounds(geometry)
         self.deliverables = deliverables
         self.bucket = gcs_bucket
+        self.int16_exports = int16_exports
 
         self.context = DAGExecutionContext(
             roi=self.roi,
@@ -102,62 +130,159 @@ class PostFireAssessment:
             "provenance": {},
         }
 
-        for d, value in outputs.items():
+        pending_statistics: Dict[str, ee.List] = {
+            d.name: value
+            for d, value in outputs.items()
+            if d.name.endswith("_AREA_STATISTICS")
+        }
+        exportable: Dict[Deliverable, ee.Image] = {}
+        visual_futures: Dict[str, Future] = {}
+        export_futures: Dict[str, Future] = {}
 
-            if d.name.endswith("_AREA_STATISTICS"):
-                result["statistics"][d.name] = value
-                continue
+        # Provenance/statistics evaluation, thumbnail URL generation and
+        # export task submission are latency-bound round-trips to Earth
+        # Engine, so they are issued concurrently rather than one by one.
+        with ThreadPoolExecutor(
+            max_workers=self.MAX_CONCURRENT_REQUESTS
+        ) as pool:
 
-            if d in VISUAL_RENDERERS:
-                vis = VISUAL_RENDERERS[d](value, self.roi)
-                result["visual"][d.name] = {
-                    "url": get_visual_thumbnail_url(vis, self.roi)
-                }
-                continue
+            summaries_future = pool.submit(
+                self._evaluate_summaries, pending_statistics
+            )
+
+            for d, value in outputs.items():
+
+                if d.name in pending_statistics:
+                    continue
+
+                if d in VISUAL_RENDERERS:
+                    vis = VISUAL_RENDERERS[d](value, self.roi)
+                    visual_futures[d.name] = pool.submit(
+                        get_visual_thumbnail_url, vis, self.roi
+                    )
+                    continue
 
-            if self.bucket:
+                if self.bucket:
+                    exportable[d] = value
+
+            # Statistics must succeed before any export task is started;
+            # otherwise a failed reduction would leave running tasks whose
+            # IDs are never returned to the caller.
+            (
+                result["provenance"],
+                result["statistics"],
+            ) = summaries_future.result()
+
+            for d, value in exportable.items():
                 object_name = self._generate_object_name(
                     deliverable=d.name.lower(),
                     start_date=self.context.inputs["start_date"],
                     end_date=self.context.inputs["end_date"],
                 )
 
-                export_result = export_geotiff_to_gcs(
+                export_futures[d.name] = pool.submit(
+                    export_geotiff_to_gcs,
                     image=value,
-                    roi=self.roi,
+                    roi=self._roi_bounds,
                     bucket=self.bucket,
                     object_name=object_name,
                     scale=self.DEFAULT_SCALE,
+                    int16=(
+                        self.int16_exports
+                        and d in self.INT16_DELIVERABLES
+                    ),
                 )
 
-                result["scientific"][d.name] = {
+            for name, future in visual_futures.items():
+                result["visual"][name] = {"url": future.result()}
+
+            for name, future in export_futures.items():
+                export_result = future.result()
+                result["scientific"][name] = {
                     "url": export_result["url"],
                     "gee_task_id": export_result["gee_task_id"],
+                    "scale_factor": export_result["scale_factor"],
                 }
 
-        # Provenance (image IDs, dates, cloud %)
-        pre_collection = self.context.get(Dependency.PRE_FIRE_COLLECTION)
-        post_collection = self.context.get(Dependency.POST_FIRE_COLLECTION)
-
-        result["provenance"] = {
-            "pre_fire": {
-                "images": self._extract_collection_provenance(pre_collection)
-                if pre_collection is not None else []
-            },
-            "post_fire": {
-                "images": self._extract_collection_provenance(post_collection)
-                if post_collection is not None else []
-            },
+        return result
+
+    def _evaluate_summaries(
+        self,
+        statistics: Dict[str, ee.List],
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Evaluate provenance (image IDs, dates, cloud %) for the pre- and
+        post-fire collections together with the deferred area statistics.
+
+        Everything is fetched in a single getInfo() round-trip.
+        """
+        collections = {
+            "pre_fire": self.context.get(Dependency.PRE_FIRE_COLLECTION),
+            "post_fire": self.context.get(Dependency.POST_FIRE_COLLECTION),
+        }
+        provenance = {
+            key: self._collection_provenance(collection)
+            for key, collection in collections.items()
+            if collection is not None
         }
 
-        return result
+        evaluated = ee.Dictionary({
+            "provenance": ee.Dictionary(provenance),
+            "statistics": ee.Dictionary(statistics),
+        }).getInfo()
+
+        provenance_result = {
+            key: {
+                "images": [
+                    f["properties"]
+                    for f in evaluated["provenance"]
+                    .get(key, {})
+                    .get("features", [])
+                ]
+            }
+            for key in collections
+        }
+        statistics_result = {
+            name: format_area_statistics(evaluated["statistics"][name])
+            for name in statistics
+        }
+
+        return provenance_result, statistics_result
 
     @staticmethod
-    def _load_geojson(path: Path) -> ee.Geometry:
+    def _load_geojson(path: Path) -> Dict[str, Any]:
         import json
         with open(path) as f:
             geojson = json.load(f)
-        return ee.Geometry(geojson["features"][0]["geometry"])
+        return geojson["features"][0]["geometry"]
+
+    @staticmethod
+    def _geojson_bounds(geometry: Dict[str, Any]) -> ee.Geometry:
+        """
+        Build the bounding rectangle of a GeoJSON geometry client-side.
+        """
+        xs: List[float] = []
+        ys: List[float] = []
+
+        def collect(node: Dict[str, Any]) -> None:
+            if node["type"] == "GeometryCollection":
+                for child in node["geometries"]:
+                    collect(child)
+                return
+
+            stack = [node["coordinates"]]
+            while stack:
+                item = stack.pop()
+                if isinstance(item[0], (int, float)):
+                    xs.append(item[0])
+                    ys.append(item[1])
+                else:
+                    stack.extend(item)
+
+        collect(geometry)
+        return ee.Geometry.Rectangle(
+            [min(xs), min(ys), max(xs), max(ys)], geodesic=False
+        )
     
     @staticmethod
     def _generate_object_name(
@@ -186,14 +311,15 @@ class PostFireAssessment:
             ) from e
 
     @staticmethod
-    def _extract_collection_provenance(
+    def _collection_provenance(
         collection: ee.ImageCollection,
-    ) -> List[Dict[str, Any]]:
+    ) -> ee.FeatureCollection:
         """
-        Extract ordered image provenance from an ImageCollection.
+        Build a deferred FeatureCollection describing image provenance.
 
         The order reflects the ImageCollection internal ordering
-        (i.e., sorted by CLOUDY_PIXEL_PERCENTAGE).
+        (i.e., sorted by CLOUDY_PIXEL_PERCENTAGE). Evaluation is left to
+        the caller so that several collections can be fetched at once.
         """
         def to_feature(img):
             return ee.Feature(
@@ -207,7 +333,4 @@ class PostFireAssessment:
                 },
             )
 
-        feature_collection = ee.FeatureCollection(collection.map(to_feature))
-        features = feature_collection.getInfo()["features"]
-
-        return [f["properties"] for f in features]
+        return ee.FeatureCollection(collection.map(to_feature))
@@ -15,6 +15,10 @@
 # - Nodes must be deterministic and free of side effects.
 # - Earth Engine execution is deferred until a terminal operation
 #   (e.g. getInfo(), export, or thumbnail generation) is triggered.
+# - The *_AREA_STATISTICS nodes return the unevaluated grouped reduction
+#   (an ee.List), not formatted statistics. Callers of execute_dag must
+#   evaluate it and pass the result to format_area_statistics(), as
+#   PostFireAssessment does.
 #
 # Responsibilities of this module:
 # - Implement all pipeline processing steps.
@@ -34,6 +38,10 @@ import ee
 from wildfire_analyser.fire_assessment.dependencies import Dependency
 from wildfire_analyser.fire_assessment.time_windows import compute_fire_time_windows
 from wildfire_analyser.fire_assessment.sentinel2 import gather_collection
+from wildfire_analyser.fire_assessment.severity import (
+    SEVERITY_LABELS,
+    classify_severity,
+)
 from wildfire_analyser.fire_assessment.mosaic_strategies import (
     apply_mosaic_strategy,
 )
@@ -296,15 +304,6 @@ def compute_rbr(context):
 # ─────────────────────────────
 
 
-SEVERITY_LABELS = {
-    0: "Unburned",
-    1: "Low Severity",
-    2: "Moderate Severity",
-    3: "High Severity",
-    4: "Very High Severity",
-}
-
-
 def format_area_statistics(stats):
     """
     Convert EE grouped reduce output into paper-ready statistics.
@@ -339,7 +338,13 @@ def format_area_statistics(stats):
     return result
 
 
-def compute_area_stats(severity: ee.Image, roi: ee.Geometry):
+def compute_area_stats(severity: ee.Image, roi: ee.Geometry) -> ee.List:
+    """
+    Build the grouped area-by-severity reduction without evaluating it.
+
+    The returned ee.List is evaluated by the caller (batched with other
+    results) and converted with format_area_statistics().
+    """
     pixel_area = ee.Image.pixelArea().divide(10_000)  # m² → ha
 
     reducer = ee.Reducer.sum().group(
@@ -359,9 +364,7 @@ def compute_area_stats(severity: ee.Image, roi: ee.Geometry):
         .get("groups")
     )
 
-    stats = ee.List(stats).getInfo()
-
-    return format_area_statistics(stats)
+    return ee.List(stats)
 
 
 @register(Dependency.DNBR_AREA_STATISTICS)
@@ -372,15 +375,7 @@ def compute_dnbr_area_statistics(context):
     if dnbr is None:
         raise RuntimeError("DNBR not available")
 
-    severity = (
-        ee.Image(0)
-        .where(dnbr.gte(0.10).And(dnbr.lt(0.27)), 1)
-        .where(dnbr.gte(0.27).And(dnbr.lt(0.44)), 2)
-        .where(dnbr.gte(0.44).And(dnbr.lt(0.66)), 3)
-        .where(dnbr.gte(0.66), 4)
-        .rename("severity")
-        .toInt8()
-    )
+    severity = classify_severity(dnbr).rename("severity").toInt8()
 
     return compute_area_stats(severity, roi)
 
@@ -413,14 +408,6 @@ def compute_rbr_area_statistics(context):
     if rbr is None:
         raise RuntimeError("RBR not available")
 
-    severity = (
-        ee.Image(0)
-        .where(rbr.gte(0.10).And(rbr.lt(0.27)), 1)
-        .where(rbr.gte(0.27).And(rbr.lt(0.44)), 2)
-        .where(rbr.gte(0.44).And(rbr.lt(0.66)), 3)
-        .where(rbr.gte(0.66), 4)
-        .rename("severity")
-        .toInt8()
-    )
+    severity = classify_severity(rbr).rename("severity").toInt8()
 
     return compute_area_stats(severity, roi)
@@ -23,12 +23,20 @@ import ee
 
 COLLECTION_ID = "COPERNICUS/S2_SR_HARMONIZED"
 
+# Spectral bands used by the pipeline and their normalized counterparts.
+SPECTRAL_BANDS = ["B2", "B3", "B4", "B8", "B12"]
+REFLECTANCE_BANDS = [f"{band}_refl" for band in SPECTRAL_BANDS]
+
+# Scene classification and cloud probability, used by the mosaic strategies
+# for masking and quality ranking.
+QA_BANDS = ["SCL", "MSK_CLDPRB"]
+
 
 def _add_reflectance_bands(image: ee.Image) -> ee.Image:
-    bands = ["B2", "B3", "B4", "B8", "B12"]
-    refl = image.select(bands).multiply(0.0001)
-    refl_names = refl.bandNames().map(lambda b: ee.String(b).cat("_refl"))
-    return image.addBands(refl.rename(refl_names))
+    # Only the QA bands are kept alongside reflectance; the raw DN bands
+    # are not used downstream. select() preserves image properties.
+    refl = image.select(SPECTRAL_BANDS).toFloat().multiply(1e-4)
+    return image.select(QA_BANDS).addBands(refl.rename(REFLECTANCE_BANDS))
 
 
 def gather_collection(
@@ -0,0 +1,49 @@
+# SPDX-License-Identifier: MIT
+#
+# Burn severity classification shared by products and renderers.
+#
+# This module defines the discrete burn severity classes used for dNBR and
+# RBR, so that area statistics and severity visuals are derived from the
+# same thresholds.
+#
+# Design notes:
+# - Classification is pure Earth Engine image arithmetic and has no
+#   dependency on the DAG registry or on visualization code.
+# - Both products.py and the visualization renderers import from here.
+#
+# Responsibilities of this module:
+# - Define the severity class labels.
+# - Classify continuous dNBR/RBR values into discrete severity classes.
+#
+# Copyright (C) 2025
+# Marcelo Camargo.
+#
+# This file is part of wildfire-analyser and is distributed under the terms
+# of the MIT license. See the LICENSE file for details.
+
+
+import ee
+
+SEVERITY_LABELS = {
+    0: "Unburned",
+    1: "Low Severity",
+    2: "Moderate Severity",
+    3: "High Severity",
+    4: "Very High Severity",
+}
+
+
+def classify_severity(image: ee.Image) -> ee.Image:
+    """
+    Classify a dNBR/RBR image into discrete severity classes
+    (0 Unburned, 1 Low, 2 Moderate, 3 High, 4 Very High).
+    """
+    # Branchless classification: each threshold crossed adds one class.
+    # Masked pixels fall back to 0 (Unburned), as with ee.Image(0).where().
+    return (
+        image.gte(0.10)
+        .add(image.gte(0.27))
+        .add(image.gte(0.44))
+        .add(image.gte(0.66))
+        .unmask(0)
+    )
@@ -23,25 +23,27 @@
 # of the MIT license. See the LICENSE file for details.
 
 
+import functools
 import logging
 from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1024)
 def compute_fire_time_windows(
     start_date: str,
     end_date: str,
     buffer_days: int,
 ) -> tuple[str, str, str, str]:
-    sd = datetime.strptime(start_date, "%Y-%m-%d")
-    ed = datetime.strptime(end_date, "%Y-%m-%d")
+    sd = datetime.strptime(start_date, "%Y-%m-%d").date()
+    ed = datetime.strptime(end_date, "%Y-%m-%d").date()
 
-    before_start = (sd - timedelta(days=buffer_days)).strftime("%Y-%m-%d")
-    before_end = (sd + timedelta(days=1)).strftime("%Y-%m-%d")  # INCLUI sd
+    before_start = (sd - timedelta(days=buffer_days)).isoformat()
+    before_end = (sd + timedelta(days=1)).isoformat()  # INCLUI sd
 
-    after_start = ed.strftime("%Y-%m-%d")
+    after_start = ed.isoformat()
     after_end = (ed + timedelta(days=buffer_days + 1)
-                 ).strftime("%Y-%m-%d")  # INCLUI ed
+                 ).isoformat()  # INCLUI ed
 
     return before_start, before_end, after_start, after_end
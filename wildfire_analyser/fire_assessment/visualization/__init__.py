@@ -12,7 +12,8 @@
 # qualitative inspection, not for quantitative analysis.
 #
 # Design notes:
-# - Each visual deliverable maps to exactly one renderer.
+# - Each visual deliverable maps to exactly one renderer; a renderer may
+#   be shared by several deliverables (e.g. pre- and post-fire RGB).
 # - Renderers must be pure functions (image + ROI → styled image).
 # - Rendering is decoupled from thumbnail generation and I/O.
 #
@@ -33,10 +34,7 @@
 
 
 from wildfire_analyser.fire_assessment.deliverables import Deliverable
-from wildfire_analyser.fire_assessment.visualization.rgb import (
-    rgb_pre_fire_visual,
-    rgb_post_fire_visual,
-)
+from wildfire_analyser.fire_assessment.visualization.rgb import rgb_visual
 
 from wildfire_analyser.fire_assessment.visualization.dnbr import dnbr_visual
 from wildfire_analyser.fire_assessment.visualization.rbr import rbr_visual
@@ -44,8 +42,8 @@ from wildfire_analyser.fire_assessment.visualization.dndvi import dndvi_visual
 from .thumbnails import get_visual_thumbnail_url
 
 VISUAL_RENDERERS = {
-    Deliverable.RGB_PRE_FIRE_VISUAL: rgb_pre_fire_visual,
-    Deliverable.RGB_POST_FIRE_VISUAL: rgb_post_fire_visual,
+    Deliverable.RGB_PRE_FIRE_VISUAL: rgb_visual,
+    Deliverable.RGB_POST_FIRE_VISUAL: rgb_visual,
     Deliverable.DNDVI_VISUAL: dndvi_visual,
     Deliverable.DNBR_VISUAL: dnbr_visual,
     Deliverable.RBR_VISUAL: rbr_visual,
@@ -30,16 +30,12 @@
 
 import ee
 
+from wildfire_analyser.fire_assessment.severity import classify_severity
+
 
 def rbr_visual(image: ee.Image, roi: ee.Geometry) -> ee.Image:
     # Classificação por faixas (paper-style)
-    classified = (
-        ee.Image(0)  # Unburned
-        .where(image.gte(0.10).And(image.lt(0.27)), 1)   # Low
-        .where(image.gte(0.27).And(image.lt(0.44)), 2)  # Moderate
-        .where(image.gte(0.44).And(image.lt(0.66)), 3)  # High
-        .where(image.gte(0.66), 4)                      # Very High
-    )
+    classified = classify_severity(image)
 
     styled = classified.visualize(
         min=0,
@@ -1,9 +1,9 @@
 # SPDX-License-Identifier: MIT
 #
-# RGB pre- and post-fire visualization renderers.
+# RGB pre- and post-fire visualization renderer.
 #
-# This module defines RGB visualization helpers for pre-fire and post-fire
-# imagery using standard Sentinel-2 reflectance bands. The renderers apply
+# This module defines the RGB visualization helper for pre-fire and post-fire
+# imagery using standard Sentinel-2 reflectance bands. A single renderer applies
 # consistent visualization parameters to enable qualitative visual comparison
 # of surface conditions before and after a wildfire event.
 #
@@ -11,7 +11,7 @@
 # - Visualization parameters (bands, min/max stretch, gamma) are fixed to
 #   ensure consistent appearance across pre- and post-fire scenes.
 # - Visualization logic is strictly separated from scientific processing;
-#   these functions do not alter or validate the underlying spectral data.
+#   this function does not alter or validate the underlying spectral data.
 # - The region of interest (ROI) is rendered as a vector outline to provide
 #   spatial context without masking surrounding areas.
 #
@@ -39,17 +39,7 @@ def _outline(roi):
     )
 
 
-def rgb_pre_fire_visual(image: ee.Image, roi: ee.Geometry) -> ee.Image:
-    vis = image.visualize(
-        bands=["red", "green", "blue"],
-        min=0.02,
-        max=0.30,
-        gamma=1.2,
-    )
-    return vis.blend(_outline(roi).visualize(palette=["000000"]))
-
-
-def rgb_post_fire_visual(image: ee.Image, roi: ee.Geometry) -> ee.Image:
+def rgb_visual(image: ee.Image, roi: ee.Geometry) -> ee.Image:
     vis = image.visualize(
         bands=["red", "green", "blue"],
         min=0.02,
@@ -3,7 +3,8 @@
 # Google Earth Engine (GEE) task monitoring utility.
 #
 # This module provides a small command-line utility to monitor the execution
-# state of a Google Earth Engine task until it completes, fails, or is cancelled.
+# state of one or more Google Earth Engine tasks until they complete, or until
+# any of them fails or is cancelled.
 #
 # It is intended to be used in automated workflows where GEE export tasks
 # (e.g. Export.image.toCloudStorage) are triggered asynchronously and their
@@ -12,12 +13,17 @@
 # Design notes:
 # - Authentication is handled via a service account JSON provided through
 #   the GEE_PRIVATE_KEY_JSON environment variable.
-# - Task monitoring uses ee.data.getTaskStatus and assumes a single task ID.
-# - Polling is time-based and does not rely on callbacks or webhooks.
+# - Task monitoring lists the project's operations once per poll
+#   (ee.data.getTaskList, backed by ee.data.listOperations) and filters
+#   them by ID. ee.data.getTaskStatus would issue one request per task ID.
+# - Polling is time-based with exponential backoff (1 s doubling up to a
+#   30 s cap) and does not rely on callbacks or webhooks.
+# - The Earth Engine client is imported on first use, keeping start-up
+#   (e.g. --help) free of the earthengine-api import cost.
 #
 # Responsibilities of this module:
 # - Authenticate against Google Earth Engine using non-interactive credentials.
-# - Monitor the lifecycle of a single GEE task.
+# - Monitor the lifecycle of one or more GEE tasks.
 # - Provide a simple CLI interface for integration into scripts and pipelines.
 #
 # Copyright (C) 2025
@@ -31,22 +37,23 @@ import json
 import os
 import sys
 import time
-import ee
 from dotenv import load_dotenv
 
-POLL_INTERVAL_SECONDS = 15
+MAX_POLL_INTERVAL_SECONDS = 30
 
 ERROR_MSG = (
     "ERROR: Unable to monitor the Google Earth Engine task.\n"
-    "Please check your GEE credentials and the provided task ID, then try again."
+    "Please check your GEE credentials and the provided task IDs, then try again."
 )
 
 SUCCESS_MSG = (
-    "\nSUCCESS: Google Earth Engine task completed successfully.\n"
+    "\nSUCCESS: Google Earth Engine task(s) completed successfully.\n"
 )
 
 
 def init_gee() -> None:
+    import ee
+
     load_dotenv()
 
     gee_key_json = os.getenv("GEE_PRIVATE_KEY_JSON")
@@ -57,39 +64,62 @@ def init_gee() -> None:
 
     credentials = ee.ServiceAccountCredentials(
         key_dict["client_email"],
-        key_data=json.dumps(key_dict),
+        key_data=gee_key_json,
     )
 
     ee.Initialize(credentials)
 
 
-def wait_for_task(gee_task_id: str) -> None:
+def wait_for_task(gee_task_ids: str | list[str]) -> None:
+    import ee
+
+    if isinstance(gee_task_ids, str):
+        gee_task_ids = [gee_task_ids]
+
+    attempt = 0
+
     while True:
-        statuses = ee.data.getTaskStatus(gee_task_id)
+        wanted = set(gee_task_ids)
+        by_id = {
+            status["id"]: status
+            for status in ee.data.getTaskList()
+            if status.get("id") in wanted
+        }
 
-        if not statuses:
-            raise RuntimeError(f"Task '{gee_task_id}' not found")
+        pending = False
+        for gee_task_id in gee_task_ids:
+            status = by_id.get(gee_task_id)
+            state = status.get("state") if status else None
 
-        status = statuses[0]
-        state = status.get("state")
+            if state in (None, "UNKNOWN"):
+                raise RuntimeError(f"Task '{gee_task_id}' not found")
 
-        print(f"[GEE] task={gee_task_id} state={state}")
+            print(f"[GEE] task={gee_task_id} state={state}")
 
-        if state == "COMPLETED":
-            return
+            if state in ("FAILED", "CANCELLED"):
+                error = status.get("error_message", "Unknown error")
+                raise RuntimeError(f"Task '{gee_task_id}' failed: {error}")
+
+            if state != "COMPLETED":
+                pending = True
 
-        if state in ("FAILED", "CANCELLED"):
-            error = status.get("error_message", "Unknown error")
-            raise RuntimeError(f"Task failed: {error}")
+        if not pending:
+            return
 
-        time.sleep(POLL_INTERVAL_SECONDS)
+        time.sleep(min(MAX_POLL_INTERVAL_SECONDS, 2 ** min(attempt, 5)))
+        attempt += 1
 
 
 def main() -> None:
     parser = argparse.ArgumentParser(
-        description="Monitor a Google Earth Engine task until completion"
+        description="Monitor Google Earth Engine tasks until completion"
+    )
+    parser.add_argument(
+        "--gee-task-id",
+        nargs="+",
+        required=True,
+        help="One or more GEE task IDs to monitor",
     )
-    parser.add_argument("--gee-task-id", required=True)
     args = parser.parse_args()
 
     init_gee()